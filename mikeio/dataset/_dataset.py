@@ -956,6 +956,9 @@ class Dataset(MutableMapping):
                     xy, n_nearest=n_nearest, **kwargs
                 )
                 das = [da.interp(x=x, y=y, interpolant=interpolant) for da in self]
+            elif isinstance(self.geometry, Grid1D):
+                interpolant = self.geometry.get_spatial_interpolant(xy)
+                das = [da.interp(x=x, interpolant=interpolant) for da in self]
             else:
                 das = [da.interp(x=x, y=y) for da in self]
             ds = Dataset(das, validate=False)
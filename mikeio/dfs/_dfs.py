@@ -54,6 +54,27 @@ def _read_item_time_step(
     return dfs, d
 
 
+def _read_item_time_step_into(dfs, itemdata, it: int, out: np.ndarray):
+    """Read a single item-timestep directly into the preallocated array `out`
+
+    mikecore fills the Data array of a supplied DfsItemData in place, so when
+    `out` is contiguous and has the item's dtype it is read without any
+    intermediate array. Otherwise the data goes through the (reused) buffer
+    of `itemdata` and is copied (and cast) to `out`.
+    """
+    buffer = itemdata.Data
+    if out.dtype == buffer.dtype and out.flags.c_contiguous:
+        itemdata.Data = out.reshape(-1)
+        res = dfs.ReadItemTimeStep(itemdata, it)
+        itemdata.Data = buffer
+    else:
+        res = dfs.ReadItemTimeStep(itemdata, it)
+        out[...] = buffer.reshape(out.shape)
+    if res is None:
+        raise ValueError(f"Error reading item {itemdata.ItemNumber}, time step {it}")
+    return res
+
+
 def _fuzzy_item_search(
     *, dfsItemInfo: List[DfsDynamicItemInfo], search: str, start_idx: int = 0
 ):
@@ -247,7 +268,34 @@ def _get_item_info(
     return ItemInfoList(items)
 
 
-def _write_dfs_data(*, dfs: DfsFile, ds: Dataset, n_spatial_dims: int) -> None:
+def _deletevalue_to_nan(data: np.ndarray, deletevalue: float) -> None:
+    """Replace deletevalue by NaN in place, one pass per sub-array along the first axis
+
+    A single boolean mask of the sub-array size is reused, instead of
+    allocating a mask of the full array size.
+    """
+    mask = np.empty(data.shape[1:], dtype=bool)
+    for d in data:
+        np.equal(d, deletevalue, out=mask)
+        if mask.any():
+            np.copyto(d, np.nan, where=mask)
+
+
+def _to_dfs_float32(data: np.ndarray, deletevalue: float) -> np.ndarray:
+    """Contiguous float32 data with NaN replaced by deletevalue
+
+    The input array is not modified. If it is already contiguous float32
+    without NaN it is returned as is, otherwise a copy is made.
+    """
+    nan_mask = np.isnan(data)
+    if data.dtype == np.float32 and data.flags.c_contiguous and not nan_mask.any():
+        return data
+    d = data.astype(np.float32, order="C")
+    d[nan_mask] = deletevalue
+    return d
+
+
+def _write_dfs_data(*, dfs: DfsFile, ds: Dataset) -> None:
 
     deletevalue = dfs.FileInfo.DeleteValueFloat  # ds.deletevalue
     has_no_time = "time" not in ds.dims
@@ -256,20 +304,13 @@ def _write_dfs_data(*, dfs: DfsFile, ds: Dataset, n_spatial_dims: int) -> None:
     else:
         t_rel = (ds.time - ds.time[0]).total_seconds()
 
-    for i in range(ds.n_timesteps):
-        for item in range(ds.n_items):
-
-            if has_no_time:
-                d = ds[item].values
-            else:
-                d = ds[item].values[i]
-            d = d.copy()  # to avoid modifying the input
-            d[np.isnan(d)] = deletevalue
-
-            d = d.reshape(ds.shape[-n_spatial_dims:])  # spatial axes
-            darray = d.flatten()
+    data_write = [_to_dfs_float32(da.to_numpy(), deletevalue) for da in ds]
+    if has_no_time:
+        data_write = [d[np.newaxis] for d in data_write]
 
-            dfs.WriteItemTimeStepNext(t_rel[i], darray.astype(np.float32))
+    for i in range(ds.n_timesteps):
+        for d in data_write:
+            dfs.WriteItemTimeStepNext(t_rel[i], d[i])
 
     dfs.Close()
 
@@ -296,6 +337,7 @@ class _Dfs123:
         self.geometry = GeometryUndefined()
         self._dfs = None
         self._source = None
+        self._open_dfs = None  # read handle kept open by a with-block
 
     def read(
         self,
@@ -317,18 +359,25 @@ class _Dfs123:
         keepdims: bool, optional
             When reading a single time step only, should the time-dimension be kept
             in the returned Dataset? by default: False
+        dtype: data-type, optional
+            Define the dtype of the returned dataset (default = np.float32,
+            the data type stored in the file)
 
         Returns
         -------
         Dataset
         """
 
-        self._open()
+        if self._open_dfs is not None:
+            dfs = self._open_dfs
+        else:
+            self._open()
+            dfs = self._dfs
 
-        item_numbers = _valid_item_numbers(self._dfs.ItemInfo, items)
+        item_numbers = _valid_item_numbers(dfs.ItemInfo, items)
         n_items = len(item_numbers)
 
-        single_time_selected, time_steps = _valid_timesteps(self._dfs.FileInfo, time)
+        single_time_selected, time_steps = _valid_timesteps(dfs.FileInfo, time)
         nt = len(time_steps) if not single_time_selected else 1
 
         shape: Tuple[int, ...]
@@ -340,40 +389,38 @@ class _Dfs123:
         else:
             shape = (nt, self._nz, self._ny, self._nx)
 
-        if single_time_selected and not keepdims:
-            shape = shape[1:]
+        # a single contiguous buffer for all items, each item is a view into it
+        data = np.empty((n_items, *shape), dtype=dtype)
+        data_list: List[np.ndarray] = list(data)
 
-        data_list: List[np.ndarray] = [
-            np.ndarray(shape=shape, dtype=dtype) for _ in range(n_items)
+        # one reusable item data buffer per item, see _read_item_time_step_into
+        item_buffers = [
+            dfs.ItemInfo[item_number].CreateEmptyItemData()
+            for item_number in item_numbers
         ]
 
-        t_seconds = np.zeros(len(time_steps))
+        t_seconds = np.empty(len(time_steps))
+        deletevalue = self.deletevalue
 
+        # dynamic data is stored time step by time step (all items in each step),
+        # keep timesteps in the outer loop to read the file sequentially
         for i, it in enumerate(tqdm(time_steps, disable=not self.show_progress)):
-            for item in range(n_items):
-
-                itemdata = self._dfs.ReadItemTimeStep(item_numbers[item] + 1, int(it))
-
-                src = itemdata.Data
-                d = src
-
-                d[d == self.deletevalue] = np.nan
+            for itemdata, d in zip(item_buffers, data_list):
+                _read_item_time_step_into(dfs, itemdata, int(it), out=d[i])
 
-                if self._ndim == 2:
-                    d = d.reshape(self._ny, self._nx)
+            t_seconds[i] = itemdata.Time
 
-                if single_time_selected:
-                    data_list[item] = d
-                else:
-                    data_list[item][i] = d
+        _deletevalue_to_nan(data, deletevalue)
 
-            t_seconds[i] = itemdata.Time
+        if single_time_selected and not keepdims:
+            data_list = [d[0] for d in data_list]
 
         time = pd.to_datetime(t_seconds, unit="s", origin=self.start_time)  # type: ignore
 
-        items = _get_item_info(self._dfs.ItemInfo, item_numbers)
+        items = _get_item_info(dfs.ItemInfo, item_numbers)
 
-        self._dfs.Close()
+        if self._open_dfs is None:
+            dfs.Close()
         return Dataset(data_list, time, items, geometry=self.geometry, validate=False)
 
     def _read_header(self):
@@ -437,16 +484,9 @@ class _Dfs123:
         self._factory = DfsFactory()
         self._set_spatial_axis()
 
-        if self._ndim == 1:
-            if not all(np.shape(d)[t_offset + 0] == self._nx for d in self._data):
-                raise DataDimensionMismatch()
-
-        if self._ndim == 2:
-            if not all(np.shape(d)[t_offset + 0] == self._ny for d in self._data):
-                raise DataDimensionMismatch()
-
-            if not all(np.shape(d)[t_offset + 1] == self._nx for d in self._data):
-                raise DataDimensionMismatch()
+        spatial_shape = shape[t_offset:]
+        if any(np.shape(d)[t_offset:] != spatial_shape for d in self._data):
+            raise DataDimensionMismatch()
 
         if neq_datetimes is not None:
             self._is_equidistant = False
@@ -458,19 +498,19 @@ class _Dfs123:
 
         deletevalue = dfs.FileInfo.DeleteValueFloat  # -1.0000000031710769e-30
 
-        for i in trange(self._n_timesteps, disable=not self.show_progress):
-            for item in range(self._n_items):
+        # convert each item once (instead of once per time step)
+        data_write = [_to_dfs_float32(d, deletevalue) for d in self._data]
+        if t_offset == 0:
+            data_write = [d[np.newaxis] for d in data_write]
 
-                d = self._data[item][i] if t_offset == 1 else self._data[item]
-                d = d.copy()  # to avoid modifying the input
-                d[np.isnan(d)] = deletevalue
+        if self._is_equidistant:
+            t_rel = np.zeros(self._n_timesteps)
+        else:
+            t_rel = np.asarray((neq_datetimes - self._start_time).total_seconds())
 
-                if self._is_equidistant:
-                    dfs.WriteItemTimeStepNext(0, d.astype(np.float32))
-                else:
-                    t = neq_datetimes[i]
-                    relt = (t - self._start_time).total_seconds()
-                    dfs.WriteItemTimeStepNext(relt, d.astype(np.float32))
+        for i in trange(self._n_timesteps, disable=not self.show_progress):
+            for d in data_write:
+                dfs.WriteItemTimeStepNext(t_rel[i], d[i])
 
         if not keep_open:
             dfs.Close()
@@ -485,31 +525,19 @@ class _Dfs123:
         data: Dataset
         """
 
+        if self._ndim == 3:
+            raise NotImplementedError("Append is not yet available for 3D files")
+        if not self._is_equidistant:
+            raise NotImplementedError(
+                "Append is not yet available for non-equidistant files"
+            )
+
         deletevalue = self._dfs.FileInfo.DeleteValueFloat  # -1.0000000031710769e-30
+        data_write = [_to_dfs_float32(da.to_numpy(), deletevalue) for da in data]
 
         for i in trange(self._n_timesteps, disable=not self.show_progress):
             for item in range(self._n_items):
-
-                d = data[item].to_numpy()[i]
-                d = d.copy()  # to avoid modifying the input
-                d[np.isnan(d)] = deletevalue
-
-                if self._ndim == 1:
-                    darray = d
-
-                if self._ndim == 2:
-                    d = d.reshape(self.shape[1:])
-                    darray = d.reshape(d.size, 1)[:, 0]
-
-                if self._ndim == 3:
-                    raise NotImplementedError("Append is not yet available for 3D files")
-
-                if self._is_equidistant:
-                    self._dfs.WriteItemTimeStepNext(0, darray.astype(np.float32))
-                else:
-                    raise NotImplementedError(
-                        "Append is not yet available for non-equidistant files"
-                    )
+                self._dfs.WriteItemTimeStepNext(0, data_write[item][i])
 
     def __enter__(self):
         return self
@@ -557,7 +585,8 @@ class _Dfs123:
             self._n_timesteps = len(data.time)
             if dt is None and len(data.time) > 1:
                 self._dt = (data.time[1] - data.time[0]).total_seconds()
-            self._data = data.to_numpy()
+            # per item arrays, stacking would copy (and upcast mixed dtypes)
+            self._data = [da.to_numpy() for da in data]
         else:
             raise TypeError("data must be supplied in the form of a mikeio.Dataset")
 
@@ -696,7 +725,10 @@ class _Dfs123:
     def end_time(self):
         """File end time"""
         if self._end_time is None:
-            self._end_time = self.read(items=[0]).time[-1].to_pydatetime()
+            # only the last time step is needed, not the entire item
+            self._end_time = (
+                self.read(items=[0], time=-1, keepdims=True).time[-1].to_pydatetime()
+            )
 
         return self._end_time
 
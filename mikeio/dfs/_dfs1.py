@@ -67,6 +67,18 @@ class Dfs1(_Dfs123):
     def _open(self):
         self._dfs = DfsFileFactory.Dfs1FileOpen(self._filename)
 
+    def __enter__(self):
+        # keep an existing file open, so repeated reads in the context reuse the handle
+        if os.path.isfile(self._filename):
+            self._open()
+            self._open_dfs = self._dfs
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self._open_dfs is not None:
+            self._open_dfs.Close()
+            self._open_dfs = None
+
     def write(
         self,
         filename,
@@ -27,7 +27,7 @@ from ..spatial import Grid3D
 
 def write_dfs3(filename: str, ds: Dataset, title="") -> None:
     dfs = _write_dfs3_header(filename, ds, title)
-    _write_dfs_data(dfs=dfs, ds=ds, n_spatial_dims=3)
+    _write_dfs_data(dfs=dfs, ds=ds)
 
 
 def _write_dfs3_header(filename, ds: Dataset, title="") -> DfsFile:
@@ -1,3 +1,4 @@
+import math
 import warnings
 from typing import Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
@@ -17,11 +18,24 @@ from ._geometry import (
 
 
 def _check_equidistant(x: np.ndarray) -> None:
+    if len(x) < 3:
+        return
     d = np.diff(x)
-    if len(d) > 0 and not np.allclose(d, d[0]):
+    # same tolerance as np.allclose(d, d[0])
+    if not np.abs(d - d[0]).max() <= 1e-8 + 1e-5 * np.abs(d[0]):
         raise NotImplementedError("values must be equidistant")
 
 
+def _index_step(idx) -> Optional[int]:
+    """Constant (positive) step of a sequence of indices, None if not equidistant"""
+    if isinstance(idx, range):
+        return idx.step if (len(idx) > 1 and idx.step >= 1) else None
+    d = np.diff(idx)
+    if len(d) == 0 or d[0] < 1 or d.min() != d.max():
+        return None
+    return int(d[0])
+
+
 def _parse_grid_axis(name, x, x0=0.0, dx=None, nx=None):
     if x is not None:
         x = np.asarray(x)
@@ -41,8 +55,50 @@ def _parse_grid_axis(name, x, x0=0.0, dx=None, nx=None):
     return x0, dx, nx
 
 
-def _print_axis_txt(name, x, dx) -> str:
-    n = len(x)
+def _equidistant_axis(x0: float, dx: float, n: int) -> np.ndarray:
+    return x0 + dx * np.arange(n, dtype=np.float64)
+
+
+def _read_only(x: np.ndarray) -> np.ndarray:
+    x.setflags(write=False)
+    return x
+
+
+def _nearest_index(x: float, x0: float, dx: float, n: int) -> int:
+    """Index of the node nearest to x on an equidistant axis"""
+    # ceil(u - 0.5) picks the lower node when x is exactly midway
+    u = (x - x0) / dx
+    return min(max(math.ceil(u - 0.5), 0), n - 1)
+
+
+def _fractional_index(x, x0: float, dx: float, n: int):
+    """Left node index (0..n-2) and fractional distance to the next node"""
+    u = (np.asarray(x, dtype=np.float64) - x0) / dx
+    i = np.clip(np.floor(u), 0, n - 2).astype(np.intp)
+    return i, u - i
+
+
+def _cell_index(x, left: float, dx: float, n: int) -> np.ndarray:
+    """Index of the cell (width dx, first cell starting at left) containing x"""
+    # in-place ufuncs: a single temporary for any number of points
+    u = np.subtract(x, left, dtype=np.float64)
+    u /= dx
+    np.floor(u, out=u)
+    i = u.astype(np.intp)
+    # points on the right edge belong to the last cell
+    np.minimum(i, n - 1, out=i)
+    return i
+
+
+def _axis_preview(x0: float, dx: float, n: int, offset: float = 0.0) -> np.ndarray:
+    """First (up to three) and last values of an equidistant axis"""
+    i = np.unique(np.minimum([0, 1, 2, n - 1], n - 1))
+    return (x0 + dx * i) + offset
+
+
+def _print_axis_txt(name, x, dx, n=None) -> str:
+    # x: all axis values, or only the _axis_preview values if n is given
+    n = len(x) if n is None else n
     txt = f"{name}: [{x[0]:0.4g}"
     if n > 1:
         txt = txt + f", {x[1]:0.4g}"
@@ -112,6 +168,7 @@ class Grid1D(_Geometry):
         assert len(self._origin) == 2, "origin must be a tuple of length 2"
         self._orientation = orientation
         self._x0, self._dx, self._nx = _parse_grid_axis("x", x, x0, dx, nx)
+        self.__x = None
 
         if node_coordinates is not None and len(node_coordinates) != self.nx:
             raise ValueError("Length of node_coordinates must be n")
@@ -124,7 +181,8 @@ class Grid1D(_Geometry):
         return 1
 
     def __repr__(self):
-        out = ["<mikeio.Grid1D>", _print_axis_txt("x", self.x, self.dx)]
+        x = _axis_preview(self._x0, self.dx, self.nx)
+        out = ["<mikeio.Grid1D>", _print_axis_txt("x", x, self.dx, self.nx)]
         return "\n".join(out)
 
     def __str__(self):
@@ -133,29 +191,35 @@ class Grid1D(_Geometry):
     def find_index(self, x: float, **kwargs) -> int:
         """Find nearest point"""
 
-        d = (self.x - x) ** 2
+        xa = np.asarray(x, dtype=np.float64).reshape(-1)
+        if len(xa) != 1:
+            raise ValueError(f"{x=} is not a scalar value")
+        if np.isnan(xa[0]):
+            raise ValueError(f"{x=} is not a valid coordinate")
 
-        return int(np.argmin(d))
+        return _nearest_index(float(xa[0]), self._x0, self._dx, self._nx)
 
     def get_spatial_interpolant(self, coords, **kwargs):
+        """Linear interpolation ids and weights for list of points
 
-        x = coords[0][0]  # TODO accept list of points
-
+        Returns arrays of length 2 for a single point, otherwise n-by-2.
+        Weights are NaN for points outside the grid.
+        """
         assert self.nx > 1, "Interpolation not possible for Grid1D with one point"
-        d = np.abs(self.x - x)
-        ids = np.argsort(d)[0:2]
+        x = np.atleast_2d(coords)[:, 0].astype(np.float64)
 
-        if x > self.x.max() or x < self.x.min():
-            weights = np.array([np.nan, np.nan])
-        else:
-            weights = 1 - d[ids] / d[ids].sum()
-            assert np.allclose(weights.sum(), 1.0)
-        assert len(ids) == 2
-        assert len(weights) == 2
+        i, w = _fractional_index(x, self._x0, self._dx, self._nx)
+
+        ids = np.column_stack([i, i + 1])
+        weights = np.column_stack([1.0 - w, w])
+        weights[(x < self.x[0]) | (x > self.x[-1])] = np.nan
+
+        if len(x) == 1:
+            return ids[0], weights[0]
         return ids, weights
 
     def interp(self, data, ids, weights):
-        return np.dot(data[:, ids], weights)
+        return (data[..., ids] * weights).sum(axis=-1)
 
     @property
     def dx(self) -> float:
@@ -165,8 +229,9 @@ class Grid1D(_Geometry):
     @property
     def x(self):
         """array of node coordinates"""
-        x1 = self._x0 + self.dx * (self.nx - 1)
-        return np.linspace(self._x0, x1, self.nx)
+        if self.__x is None:
+            self.__x = _read_only(_equidistant_axis(self._x0, self._dx, self._nx))
+        return self.__x
 
     @property
     def nx(self) -> int:
@@ -408,8 +473,8 @@ class Grid2D(_Geometry):
         self._origin = (0.0, 0.0) if origin is None else (origin[0], origin[1])
         assert len(self._origin) == 2, "origin must be a tuple of length 2"
         self._orientation = orientation
-        self.__xx = None
-        self.__yy = None
+        self.__x = None
+        self.__y = None
 
         self._axis_names = axis_names
 
@@ -521,8 +586,15 @@ class Grid2D(_Geometry):
         out = (
             ["<mikeio.Grid2D> (spectral)"] if self.is_spectral else ["<mikeio.Grid2D>"]
         )
-        out.append(_print_axis_txt("x", self.x, self.dx))
-        out.append(_print_axis_txt("y", self.y, self.dy))
+        if self.is_spectral and self.dx > 1:
+            out.append(_print_axis_txt("x", self.x, self.dx))
+        else:
+            ox = 0.0 if (self._is_rotated or self.is_spectral) else self._origin[0]
+            x = _axis_preview(self._x0, self.dx, self.nx, ox)
+            out.append(_print_axis_txt("x", x, self.dx, self.nx))
+        oy = 0.0 if self._is_rotated else self._origin[1]
+        y = _axis_preview(self._y0, self.dy, self.ny, oy)
+        out.append(_print_axis_txt("y", y, self.dy, self.ny))
         if self._is_rotated:
             ox, oy = self.origin
             out.append(
@@ -549,11 +621,15 @@ class Grid2D(_Geometry):
     @property
     def x(self):
         """array of x coordinates (element center)"""
+        if self.__x is None:
+            self.__x = _read_only(self._create_x())
+        return self.__x
+
+    def _create_x(self):
         if self.is_spectral and self.dx > 1:
             return self._logarithmic_f(self.nx, self._x0, self.dx)
 
-        x1 = self._x0 + self.dx * (self.nx - 1)
-        x_local = np.linspace(self._x0, x1, self.nx)
+        x_local = _equidistant_axis(self._x0, self._dx, self._nx)
         if self._is_rotated or self.is_spectral:
             return x_local
         else:
@@ -585,9 +661,11 @@ class Grid2D(_Geometry):
     @property
     def y(self):
         """array of y coordinates (element center)"""
-        y1 = self._y0 + self.dy * (self.ny - 1)
-        y_local = np.linspace(self._y0, y1, self.ny)
-        return y_local if self._is_rotated else y_local + self._origin[1]
+        if self.__y is None:
+            y_local = _equidistant_axis(self._y0, self._dy, self._ny)
+            y = y_local if self._is_rotated else y_local + self._origin[1]
+            self.__y = _read_only(y)
+        return self.__y
 
     @property
     def nx(self) -> int:
@@ -618,35 +696,33 @@ class Grid2D(_Geometry):
             raise NotImplementedError("Only available if orientation = 0")
         if self.is_spectral:
             raise NotImplementedError("Not available for spectral Grid2D")
-        left = self.x[0] - self.dx / 2
-        bottom = self.y[0] - self.dy / 2
-        right = self.x[-1] + self.dx / 2
-        top = self.y[-1] + self.dy / 2
+        ox, oy = self._origin
+        x0, y0 = self._x0 + ox, self._y0 + oy
+        x1 = (self._x0 + self._dx * (self._nx - 1)) + ox
+        y1 = (self._y0 + self._dy * (self._ny - 1)) + oy
+        left = x0 - self.dx / 2
+        bottom = y0 - self.dy / 2
+        right = x1 + self.dx / 2
+        top = y1 + self.dy / 2
         return BoundingBox(left, bottom, right, top)
 
     @property
     def _xx(self):
-        """2d array of all x-coordinates"""
-        if self.__xx is None:
-            self._create_meshgrid(self.x, self.y)
-        return self.__xx
+        """2d array of all x-coordinates (read-only view)"""
+        return np.broadcast_to(self.x, (self.ny, self.nx))
 
     @property
     def _yy(self):
-        """2d array of all y-coordinates"""
-        if self.__yy is None:
-            self._create_meshgrid(self.x, self.y)
-        return self.__yy
-
-    def _create_meshgrid(self, x, y):
-        self.__xx, self.__yy = np.meshgrid(x, y)
+        """2d array of all y-coordinates (read-only view)"""
+        return np.broadcast_to(self.y[:, np.newaxis], (self.ny, self.nx))
 
     @property
     def xy(self):
         """n-by-2 array of x- and y-coordinates"""
-        xcol = self._xx.reshape(-1, 1)
-        ycol = self._yy.reshape(-1, 1)
-        return np.column_stack([xcol, ycol])
+        xy = np.empty((self.ny, self.nx, 2))
+        xy[..., 0] = self.x
+        xy[..., 1] = self.y[:, np.newaxis]
+        return xy.reshape(-1, 2)
 
     @property
     def coordinates(self):
@@ -678,6 +754,7 @@ class Grid2D(_Geometry):
             x0, y0 = self._x0, self._y0
             self._x0, self._y0 = 0.0, 0.0
             self._origin = (self._origin[0] + x0, self._origin[1] + y0)
+            self.__x = self.__y = None
 
     def contains(self, coords):
         """test if a list of points are inside grid
@@ -695,9 +772,12 @@ class Grid2D(_Geometry):
         coords = np.atleast_2d(coords)
         y = coords[:, 1]
         x = coords[:, 0]
+        return self._inside_bbox(x, y, self.bbox)
 
-        xinside = (self.bbox.left <= x) & (x <= self.bbox.right)
-        yinside = (self.bbox.bottom <= y) & (y <= self.bbox.top)
+    @staticmethod
+    def _inside_bbox(x, y, bbox):
+        xinside = (bbox.left <= x) & (x <= bbox.right)
+        yinside = (bbox.bottom <= y) & (y <= bbox.top)
         return xinside & yinside
 
     def __contains__(self, pt) -> bool:
@@ -748,9 +828,14 @@ class Grid2D(_Geometry):
                 raise ValueError("x,y and coords cannot be given at the same time!")
             coords = np.column_stack([np.atleast_1d(x), np.atleast_1d(y)])
         elif x is not None:
-            return np.atleast_1d(np.argmin(np.abs(self.x - x))), None
+            if self.is_spectral and self.dx > 1:
+                # logarithmic frequency axis
+                return np.atleast_1d(np.argmin(np.abs(self.x - x))), None
+            i = _nearest_index(x, self.x[0], self.dx, self.nx)
+            return np.atleast_1d(i), None
         elif y is not None:
-            return None, np.atleast_1d(np.argmin(np.abs(self.y - y)))
+            j = _nearest_index(y, self.y[0], self.dy, self.ny)
+            return None, np.atleast_1d(j)
 
         if coords is not None:
             return self._xy_to_index(coords)
@@ -763,19 +848,55 @@ class Grid2D(_Geometry):
         y = xy[:, 1]
         x = xy[:, 0]
 
-        ii = (-999999999) * np.ones_like(x, dtype=int)
-        jj = (-999999999) * np.ones_like(y, dtype=int)
-
-        inside = self.contains(xy)
-        if np.any(~inside):
+        bbox = self.bbox
+        inside = self._inside_bbox(x, y, bbox)
+        if not inside.all():
             raise OutsideModelDomainError(x=x[~inside], y=y[~inside])
 
         # get index in x, and y for points inside based on the grid spacing and origin
-        ii = np.floor((x - (self.x[0] - self.dx / 2)) / self.dx).astype(int)
-        jj = np.floor((y - (self.y[0] - self.dy / 2)) / self.dy).astype(int)
+        ii = _cell_index(x, bbox.left, self.dx, self.nx)
+        jj = _cell_index(y, bbox.bottom, self.dy, self.ny)
 
         return ii, jj
 
+    def fractional_indices(self, coords):
+        """Fractional (bilinear) indices of point(s) relative to the cell centers
+
+        Compute once and reuse for interpolating several fields
+        to the same points::
+
+            i, j, wx, wy = g.fractional_indices(coords)
+            v = (
+                (1 - wx) * (1 - wy) * field[j, i]
+                + wx * (1 - wy) * field[j, i + 1]
+                + (1 - wx) * wy * field[j + 1, i]
+                + wx * wy * field[j + 1, i + 1]
+            )
+
+        Parameters
+        ----------
+        coords : array(float)
+            xy-coordinate of points given as n-by-2 array
+
+        Returns
+        -------
+        array(int), array(int), array(float), array(float)
+            i- and j-index of the lower-left cell center and the
+            fractional distances wx, wy towards the next cell center.
+            wx, wy are outside [0, 1] for points outside the cell centers.
+        """
+        if self._is_rotated:
+            raise NotImplementedError("Only available if orientation = 0")
+        if self.is_spectral and self.dx > 1:
+            raise NotImplementedError("Not available for logarithmic frequency axis")
+        if self.nx < 2 or self.ny < 2:
+            raise ValueError("Grid must have at least 2 cells in each direction")
+
+        coords = np.atleast_2d(coords)
+        i, wx = _fractional_index(coords[:, 0], self.x[0], self.dx, self.nx)
+        j, wy = _fractional_index(coords[:, 1], self.y[0], self.dy, self.ny)
+        return i, j, wx, wy
+
     def _bbox_to_index(
         self, bbox: Union[Sequence[float], BoundingBox]
     ) -> Union[Tuple[None, None], Tuple[range, range]]:
@@ -786,18 +907,20 @@ class Grid2D(_Geometry):
             )
 
         x0, y0, x1, y1 = bbox
-        if x0 > self.x[-1] or y0 > self.y[-1] or x1 < self.x[0] or y1 < self.y[0]:
+
+        # axes are sorted: find the cells with center inside [x0, x1] and [y0, y1]
+        i = range(
+            np.searchsorted(self.x, x0, side="left"),
+            np.searchsorted(self.x, x1, side="right"),
+        )
+        j = range(
+            np.searchsorted(self.y, y0, side="left"),
+            np.searchsorted(self.y, y1, side="right"),
+        )
+        if len(i) == 0 or len(j) == 0:
             warnings.warn("No elements in bbox")
             return None, None
 
-        mask = (self.x >= x0) & (self.x <= x1)
-        ii = np.where(mask)[0]
-        mask = (self.y >= y0) & (self.y <= y1)
-        jj = np.where(mask)[0]
-
-        i = range(ii[0], ii[-1] + 1)
-        j = range(jj[0], jj[-1] + 1)
-
         return i, j
 
     def isel(
@@ -815,8 +938,7 @@ class Grid2D(_Geometry):
         axis = axis + 2 if axis < 0 else axis
 
         if not np.isscalar(idx):
-            d = np.diff(idx)
-            if np.any(d < 1) or not np.allclose(d, d[0]):
+            if _index_step(idx) is None:
                 return GeometryUndefined()
             else:
                 ii = idx if axis == 1 else None
@@ -841,16 +963,14 @@ class Grid2D(_Geometry):
         jj = range(self.ny) if jj is None else jj
         assert len(ii) > 1 and len(jj) > 1, "Index must be at least len 2"
         assert ii[-1] < self.nx and jj[-1] < self.ny, "Index out of bounds"
-        di = np.diff(ii)
-        dj = np.diff(jj)
-        if (np.any(di < 1) or not np.allclose(di, di[0])) or (
-            np.any(dj < 1) or not np.allclose(dj, dj[0])
-        ):
+        di = _index_step(ii)
+        dj = _index_step(jj)
+        if di is None or dj is None:
             warnings.warn("Axis not equidistant! Will return GeometryUndefined()")
             return GeometryUndefined()
         else:
-            dx = self.dx * di[0]
-            dy = self.dy * dj[0]
+            dx = self.dx * di
+            dy = self.dy * dj
             x0 = self._x0 + (self.x[ii[0]] - self.x[0])
             y0 = self._y0 + (self.y[jj[0]] - self.y[0])
             origin = None if self._shift_origin_on_write else self.origin
@@ -879,15 +999,13 @@ class Grid2D(_Geometry):
 
     def _to_element_table(self, index_base=0):
 
-        elem_table = []
-        for elx in range(self.nx - 1):
-            # each col
-            for ely in range(self.ny - 1):
-                # each row (in this col)
-                n1 = ely * self.nx + elx + index_base
-                n2 = (ely + 1) * self.nx + elx + index_base
-                elem_table.append([n1, n1 + 1, n2 + 1, n2])
-        return elem_table
+        # elements ordered column by column (x outer, y inner)
+        elx = np.arange(self.nx - 1)[:, np.newaxis]
+        ely = np.arange(self.ny - 1)[np.newaxis, :]
+        n1 = (ely * self.nx + elx + index_base).ravel()
+        n2 = n1 + self.nx
+        elem_table = np.column_stack([n1, n1 + 1, n2 + 1, n2])
+        return list(elem_table)
 
     @staticmethod
     def _centers_to_nodes(x):
@@ -942,20 +1060,22 @@ class Grid2D(_Geometry):
         gn = Grid2D(x=xn, y=yn)
 
         # node coordinates
-        x = gn.xy[:, 0]
-        y = gn.xy[:, 1]
+        x = gn._xx.ravel()
+        y = gn._yy.ravel()
         n = gn.nx * gn.ny
 
         zn = np.zeros_like(x)
         if z is not None:
             zn[:] = z
 
+        # nodes are ordered row by row (x fastest)
+        nx, ny = gn.nx, gn.ny
         codes = np.zeros(n, dtype=int)
-        codes[y == y[-1]] = north
-        codes[x == x[-1]] = east
-        codes[y == y[0]] = south
-        codes[x == x[0]] = west
-        codes[(y == y[-1]) & (x == x[0])] = 5  # corner->north
+        codes[nx * (ny - 1) :] = north
+        codes[nx - 1 :: nx] = east
+        codes[:nx] = south
+        codes[::nx] = west
+        codes[nx * (ny - 1)] = 5  # corner->north
 
         nc = np.column_stack([x, y, zn])
         elem_table = gn._to_element_table(index_base=0)
@@ -1039,6 +1159,9 @@ class Grid3D(_Geometry):
         self._projstr = projection  # TODO handle other types than string
         self._origin = origin
         self._orientation = orientation
+        self.__x = None
+        self.__y = None
+        self.__z = None
 
     @property
     def ndim(self) -> int:
@@ -1051,9 +1174,11 @@ class Grid3D(_Geometry):
     @property
     def x(self):
         """array of x-axis coordinates (element center)"""
-        x1 = self._x0 + self.dx * (self.nx - 1)
-        x_local = np.linspace(self._x0, x1, self.nx)
-        return x_local if self._is_rotated else x_local + self.origin[0]
+        if self.__x is None:
+            x_local = _equidistant_axis(self._x0, self._dx, self._nx)
+            x = x_local if self._is_rotated else x_local + self.origin[0]
+            self.__x = _read_only(x)
+        return self.__x
 
     @property
     def dx(self) -> float:
@@ -1068,9 +1193,11 @@ class Grid3D(_Geometry):
     @property
     def y(self):
         """array of y-axis coordinates (element center)"""
-        y1 = self._y0 + self.dy * (self.ny - 1)
-        y_local = np.linspace(self._y0, y1, self.ny)
-        return y_local if self._is_rotated else y_local + self.origin[1]
+        if self.__y is None:
+            y_local = _equidistant_axis(self._y0, self._dy, self._ny)
+            y = y_local if self._is_rotated else y_local + self.origin[1]
+            self.__y = _read_only(y)
+        return self.__y
 
     @property
     def dy(self) -> float:
@@ -1085,8 +1212,9 @@ class Grid3D(_Geometry):
     @property
     def z(self):
         """array of z-axis node coordinates"""
-        z1 = self._z0 + self.dz * (self.nz - 1)
-        return np.linspace(self._z0, z1, self.nz)
+        if self.__z is None:
+            self.__z = _read_only(_equidistant_axis(self._z0, self._dz, self._nz))
+        return self.__z
 
     @property
     def dz(self) -> float:
@@ -1132,8 +1260,7 @@ class Grid3D(_Geometry):
         axis = axis + 3 if axis < 0 else axis
 
         if not np.isscalar(idx):
-            d = np.diff(idx)
-            if np.any(d < 1) or not np.allclose(d, d[0]):
+            if _index_step(idx) is None:
                 return GeometryUndefined()
             else:
                 ii = idx if axis == 2 else None
@@ -1158,17 +1285,27 @@ class Grid3D(_Geometry):
         elif axis == 1:
             # y is the second axis! return x-z Grid2D
             # TODO: origin, how to pass self.y[idx]?
+            ox = 0.0 if self._is_rotated else self.origin[0]
             return Grid2D(
-                x=self.x,
-                y=self.z,
+                x0=self._x0 + ox,
+                dx=self.dx,
+                nx=self.nx,
+                y0=self._z0,
+                dy=self.dz,
+                ny=self.nz,
                 # projection=self._projection,
             )
         elif axis == 2:
             # x is the last axis! return y-z Grid2D
             # TODO: origin, how to pass self.x[idx]?
+            oy = 0.0 if self._is_rotated else self.origin[1]
             return Grid2D(
-                x=self.y,
-                y=self.z,
+                x0=self._y0 + oy,
+                dx=self.dy,
+                nx=self.ny,
+                y0=self._z0,
+                dy=self.dz,
+                ny=self.nz,
                 # projection=self._projection,
             )
         else:
@@ -1184,23 +1321,19 @@ class Grid3D(_Geometry):
         assert (
             ii[-1] < self.nx and jj[-1] < self.ny and kk[-1] < self.nz
         ), "Index out of bounds"
-        di = np.diff(ii)
-        dj = np.diff(jj)
-        dk = np.diff(kk)
-        if (
-            (np.any(di < 1) or not np.allclose(di, di[0]))
-            or (np.any(dj < 1) or not np.allclose(dj, dj[0]))
-            or (np.any(dk < 1) or not np.allclose(dk, dk[0]))
-        ):
+        di = _index_step(ii)
+        dj = _index_step(jj)
+        dk = _index_step(kk)
+        if di is None or dj is None or dk is None:
             warnings.warn("Axis not equidistant! Will return GeometryUndefined()")
             return GeometryUndefined()
         else:
-            dx = self.dx * di[0]
-            dy = self.dy * dj[0]
-            dz = self.dz * dk[0]
-            x0 = self._x0 + (self.x[ii[0]] - self.x[0])
-            y0 = self._y0 + (self.y[jj[0]] - self.y[0])
-            z0 = self._z0 + (self.z[kk[0]] - self.z[0])
+            dx = self.dx * di
+            dy = self.dy * dj
+            dz = self.dz * dk
+            x0 = self._x0 + self.dx * ii[0]
+            y0 = self._y0 + self.dy * jj[0]
+            z0 = self._z0 + self.dz * kk[0]
             if self._is_rotated:
                 # rotated => most be projected
                 cart = Cartography.CreateProjOrigin(
@@ -1229,9 +1362,13 @@ class Grid3D(_Geometry):
 
     def __repr__(self):
         out = ["<mikeio.Grid3D>"]
-        out.append(_print_axis_txt("x", self.x, self.dx))
-        out.append(_print_axis_txt("y", self.y, self.dy))
-        out.append(_print_axis_txt("z", self.z, self.dz))
+        ox, oy = (0.0, 0.0) if self._is_rotated else self.origin
+        x = _axis_preview(self._x0, self.dx, self.nx, ox)
+        y = _axis_preview(self._y0, self.dy, self.ny, oy)
+        z = _axis_preview(self._z0, self.dz, self.nz)
+        out.append(_print_axis_txt("x", x, self.dx, self.nx))
+        out.append(_print_axis_txt("y", y, self.dy, self.ny))
+        out.append(_print_axis_txt("z", z, self.dz, self.nz))
         out.append(
             f"origin: ({self._origin[0]:.4g}, {self._origin[1]:.4g}), orientation: {self._orientation:.3f}"
         )
@@ -99,6 +99,104 @@ def test_read_time_steps():
     assert data.shape == (2, 3)  # time, x
 
 
+def test_read_single_time_step_keepdims():
+
+    filename = r"tests/testdata/random.dfs1"
+    dfs = mikeio.open(filename)
+    ds_all = dfs.read()
+
+    ds = dfs.read(time=5)
+    assert ds.dims == ("x",)
+    assert ds[0].shape == (3,)
+
+    ds = dfs.read(time=5, keepdims=True)
+    assert ds.dims == ("time", "x")
+    assert ds[0].shape == (1, 3)
+    assert ds.time[0] == ds_all.time[5]
+    assert np.array_equal(ds[0].to_numpy()[0], ds_all[0].to_numpy()[5], equal_nan=True)
+
+
+def test_read_sparse_time_steps():
+
+    filename = r"tests/testdata/random.dfs1"
+    dfs = mikeio.open(filename)
+    ds_all = dfs.read()
+
+    ds = dfs.read(time=[3, 50, 99])
+    assert all(ds.time == ds_all.time[[3, 50, 99]])
+    assert np.array_equal(
+        ds[0].to_numpy(), ds_all[0].to_numpy()[[3, 50, 99]], equal_nan=True
+    )
+
+
+def test_read_dtype():
+
+    filename = r"tests/testdata/random.dfs1"
+    dfs = mikeio.open(filename)
+
+    ds32 = dfs.read()
+    ds64 = dfs.read(dtype=np.float64)
+    assert ds32[0].dtype == np.float32
+    assert ds64[0].dtype == np.float64
+    assert np.allclose(ds32[0].to_numpy(), ds64[0].to_numpy(), equal_nan=True)
+
+
+def test_read_time_steps_iterator():
+
+    filename = r"tests/testdata/random.dfs1"
+    dfs = mikeio.open(filename)
+
+    ds_list = dfs.read(time=[3, 5, 8])
+    ds_iter = dfs.read(time=(i for i in [3, 5, 8]))
+    assert all(ds_iter.time == ds_list.time)
+    assert np.array_equal(ds_iter[0].to_numpy(), ds_list[0].to_numpy())
+
+
+def test_read_in_context_manager():
+
+    filename = r"tests/testdata/random.dfs1"
+    ds_all = mikeio.read(filename)
+
+    with mikeio.open(filename) as dfs:
+        ds1 = dfs.read(time=3)
+        ds2 = dfs.read(items=[0], time=[3, 5])
+        assert dfs.end_time == ds_all.end_time
+
+    assert np.array_equal(ds1[0].to_numpy(), ds_all[0].to_numpy()[3])
+    assert np.array_equal(ds2[0].to_numpy(), ds_all[0].to_numpy()[[3, 5]])
+
+    # the file is opened again when reading outside the context
+    ds = dfs.read()
+    assert ds.n_timesteps == ds_all.n_timesteps
+
+
+def test_write_in_context_manager_new_file(tmp_path):
+
+    fp = tmp_path / "random.dfs1"
+    ds = mikeio.read("tests/testdata/random.dfs1")
+
+    with Dfs1() as dfs:
+        dfs.write(fp, ds)
+
+    ds2 = mikeio.read(fp)
+    assert np.array_equal(ds2[0].to_numpy(), ds[0].to_numpy())
+
+
+def test_write_then_read_in_context_manager(tmp_path):
+
+    filename = r"tests/testdata/random.dfs1"
+    fp = tmp_path / "random.dfs1"
+    ds_all = mikeio.read(filename)
+
+    with mikeio.open(filename) as dfs:
+        ds1 = dfs.read(time=[0, 1])
+        dfs.write(fp, ds1)
+        ds2 = dfs.read(time=3)
+
+    assert np.array_equal(ds2[0].to_numpy(), ds_all[0].to_numpy()[3])
+    assert mikeio.read(fp).n_timesteps == 2
+
+
 def test_write_some_time_steps_new_file(tmp_path):
 
     fp = tmp_path / "random.dfs1"
@@ -150,6 +248,13 @@ def test_read_start_end_time():
     assert dfs.end_time == ds.end_time
 
 
+def test_end_time_single_point():
+    dfs = mikeio.open("tests/testdata/nx1.dfs1")
+    ds = dfs.read()
+
+    assert dfs.end_time == ds.time[-1]
+
+
 def test_read_start_end_time_relative_time():
 
     dfs = mikeio.open("tests/testdata/physical_basin_wave_maker_signal.dfs1")
@@ -255,3 +360,69 @@ def test_interp_onepoint_dfs1():
 
     with pytest.raises(AssertionError, match="not possible for Grid1D with one point"):
         ds[0].interp(x=0)
+
+
+def test_write_read_nan_roundtrip(tmp_path):
+
+    fp = tmp_path / "nan.dfs1"
+    data = np.arange(12, dtype=np.float32).reshape(4, 3)
+    data[1, 2] = np.nan
+    data[3, 0] = np.nan
+    time = pd.date_range("2000-1-1", periods=4, freq="H")
+    da = mikeio.DataArray(data=data, time=time, geometry=mikeio.Grid1D(nx=3, dx=1))
+    mikeio.Dataset([da]).to_dfs(fp)
+
+    ds = mikeio.read(fp)
+    assert np.array_equal(ds[0].to_numpy(), data, equal_nan=True)
+    ds = mikeio.read(fp, time=1)
+    assert np.isnan(ds[0].to_numpy()[2])
+
+
+def test_write_does_not_modify_input(tmp_path):
+
+    fp = tmp_path / "nan.dfs1"
+    data = np.arange(12, dtype=np.float64).reshape(4, 3)
+    data[1, 2] = np.nan
+    original = data.copy()
+    time = pd.date_range("2000-1-1", periods=4, freq="H")
+    da = mikeio.DataArray(data=data, time=time, geometry=mikeio.Grid1D(nx=3, dx=1))
+    ds = mikeio.Dataset([da])
+
+    Dfs1().write(fp, ds)
+    Dfs1().write(fp, ds)
+
+    assert np.array_equal(ds[0].to_numpy(), original, equal_nan=True)
+    assert ds[0].dtype == np.float64
+
+
+def test_write_read_non_equidistant_time(tmp_path):
+
+    fp = tmp_path / "neq.dfs1"
+    time = pd.DatetimeIndex(["2000-1-1", "2000-1-1 01:00", "2000-1-1 03:30"])
+    da = mikeio.DataArray(
+        data=np.zeros((3, 4)), time=time, geometry=mikeio.Grid1D(nx=4, dx=1)
+    )
+    da.to_dfs(fp)
+
+    ds = mikeio.read(fp)
+    assert not ds.is_equidistant
+    assert all(ds.time == time)
+
+
+def test_write_mixed_dtypes(tmp_path):
+
+    fp = tmp_path / "mixed.dfs1"
+    time = pd.date_range("2000-1-1", periods=2, freq="H")
+    g = mikeio.Grid1D(nx=3, dx=1)
+    da32 = mikeio.DataArray(
+        np.ones((2, 3), dtype=np.float32), time=time, geometry=g, item="a"
+    )
+    da64 = mikeio.DataArray(
+        np.full((2, 3), 0.1, dtype=np.float64), time=time, geometry=g, item="b"
+    )
+    mikeio.Dataset([da32, da64]).to_dfs(fp)
+
+    ds = mikeio.read(fp)
+    assert ds["a"].dtype == np.float32
+    assert ds["b"].dtype == np.float32
+    assert np.allclose(ds["b"].to_numpy(), 0.1)
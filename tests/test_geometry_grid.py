@@ -3,7 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 from mikeio import Mesh
-from mikeio import Grid2D, Grid1D
+from mikeio import Grid2D, Grid1D, Grid3D
 from mikeio.spatial._FM_geometry import GeometryFM2D
 from mikeio.spatial import GeometryUndefined
 from mikeio.exceptions import OutsideModelDomainError
@@ -48,6 +48,47 @@ def test_grid1d_isel():
     )  # the only info we have is how far along a 1d axis we are, not enough to create a 2d point
 
 
+def test_grid1d_find_index():
+    g = Grid1D(x0=2.0, dx=0.5, nx=5)
+
+    assert g.find_index(2.0) == 0
+    assert g.find_index(2.7) == 1
+    assert g.find_index(3.25) == 2  # midway: lower node
+    assert g.find_index(4.0) == 4
+    assert g.find_index(-10.0) == 0
+    assert g.find_index(10.0) == 4
+
+    for x in np.linspace(0.0, 6.0, 61):
+        assert g.find_index(x) == np.argmin((g.x - x) ** 2)
+
+    assert g.find_index([2.7]) == 1
+    assert g.find_index(np.array([2.7])) == 1
+
+    with pytest.raises(ValueError, match="scalar"):
+        g.find_index([2.0, 3.0])
+
+    with pytest.raises(ValueError, match="valid"):
+        g.find_index(np.nan)
+
+
+def test_grid1d_spatial_interpolant():
+    g = Grid1D(x0=2.0, dx=0.5, nx=5)
+    data = np.array([[0.0, 1.0, 4.0, 9.0, 16.0], [1.0, 1.0, 1.0, 1.0, 1.0]])
+
+    ids, weights = g.get_spatial_interpolant([(2.6, None)])
+    assert ids.shape == (2,)
+    assert weights.sum() == pytest.approx(1.0)
+    assert g.interp(data, ids, weights) == pytest.approx([1.6, 1.0])
+
+    xi = [2.0, 2.6, 3.75, 4.0, 1.9, 4.1]
+    ids, weights = g.get_spatial_interpolant([(x, None) for x in xi])
+    assert ids.shape == (6, 2)
+    dai = g.interp(data, ids, weights)
+    assert dai.shape == (2, 6)
+    assert dai[0, :4] == pytest.approx(np.interp(xi[:4], g.x, data[0]))
+    assert np.all(np.isnan(dai[:, 4:]))
+
+
 def test_grid1d_equality():
     g1 = Grid1D(dx=0.1, nx=10)
     g2 = Grid1D(dx=0.1, nx=10)
@@ -156,6 +197,11 @@ def test_xx_yy():
     assert np.all(g.xy[1] == [3.0, 3.0])
     assert np.all(g.coordinates[1] == [3.0, 3.0])
 
+    xx, yy = np.meshgrid(x, y)
+    assert np.all(g._xx == xx)
+    assert np.all(g._yy == yy)
+    assert np.all(g.xy == np.column_stack([xx.ravel(), yy.ravel()]))
+
     g2 = Grid2D(x=x, y=y)
 
     # Reverse order compared to above makes no difference
@@ -163,6 +209,21 @@ def test_xx_yy():
     assert g2._xx[0, 0] == 1.0
 
 
+def test_axes_are_cached_and_read_only():
+    g = Grid2D(x0=10.0, y0=20.0, dx=1.0, nx=4, ny=3)
+    assert g.x is g.x
+    assert g.y is g.y
+    with pytest.raises(ValueError):
+        g.x[0] = 0.0
+
+    x, y = g.x.copy(), g.y.copy()
+    g._shift_x0y0_to_origin()
+    assert g._x0 == 0.0
+    assert g.origin == (10.0, 20.0)
+    assert np.allclose(g.x, x)
+    assert np.allclose(g.y, y)
+
+
 def test_create_in_bbox():
     bbox = [0, 0, 1, 5]
     g = Grid2D(bbox=bbox, nx=2, ny=5)
@@ -278,6 +339,72 @@ def test_find_index():
         g.find_index(coords=[(-0.1, 0.1), (-0.1, 0.1)])
 
 
+def test_find_index_on_bbox_edge():
+    g = Grid2D(nx=3, ny=2, dx=1.0)
+    ii, jj = g.find_index(coords=[(-0.5, -0.5), (2.5, 1.5)])
+    assert list(ii) == [0, 2]
+    assert list(jj) == [0, 1]
+
+
+def test_find_index_area():
+    g = Grid2D(bbox=[0, 0, 1, 5], dx=0.2)
+
+    ii, jj = g.find_index(area=(0.2, 1.0, 0.6, 2.0))
+    assert ii == range(1, 3)
+    assert jj == range(5, 10)
+
+    ii, jj = g.find_index(area=g.bbox)
+    assert ii == range(g.nx)
+    assert jj == range(g.ny)
+
+    with pytest.warns(UserWarning, match="No elements"):
+        ii, jj = g.find_index(area=(0.41, 1.0, 0.49, 2.0))
+    assert ii is None and jj is None
+
+
+def test_find_index_single_axis():
+    g = Grid2D(x0=1.0, dx=0.5, nx=6, y0=-2.0, dy=2.0, ny=4, origin=(10.0, 20.0))
+    for x in np.linspace(10.0, 15.0, 41):
+        ii, jj = g.find_index(x=x)
+        assert jj is None
+        assert ii[0] == np.argmin(np.abs(g.x - x))
+    for y in np.linspace(15.0, 30.0, 31):
+        ii, jj = g.find_index(y=y)
+        assert ii is None
+        assert jj[0] == np.argmin(np.abs(g.y - y))
+
+    g = Grid2D(x0=0.05, dx=1.1, nx=20, y0=0.0, dy=15.0, ny=24, is_spectral=True)
+    ii, _ = g.find_index(x=0.3)
+    assert ii[0] == np.argmin(np.abs(g.x - 0.3))
+
+
+def test_fractional_indices():
+    g = Grid2D(x0=1.0, dx=0.5, nx=6, y0=-2.0, dy=2.0, ny=4, origin=(10.0, 20.0))
+    xx, yy = np.meshgrid(g.x, g.y)
+    field = 3.0 * xx - 2.0 * yy + 1.0  # bilinear interpolation is exact
+
+    coords = np.array([[11.2, 18.5], [g.x[0], g.y[0]], [g.x[-1], g.y[-1]]])
+    i, j, wx, wy = g.fractional_indices(coords)
+    assert np.all(i <= g.nx - 2) and np.all(j <= g.ny - 2)
+    assert np.all((0 <= wx) & (wx <= 1)) and np.all((0 <= wy) & (wy <= 1))
+    v = (
+        (1 - wx) * (1 - wy) * field[j, i]
+        + wx * (1 - wy) * field[j, i + 1]
+        + (1 - wx) * wy * field[j + 1, i]
+        + wx * wy * field[j + 1, i + 1]
+    )
+    assert v == pytest.approx(3.0 * coords[:, 0] - 2.0 * coords[:, 1] + 1.0)
+
+    _, _, wx, _ = g.fractional_indices([g.x[0] - 1.0, g.y[0]])
+    assert wx[0] < 0
+
+
+def test_fractional_indices_rotated_not_implemented():
+    g = Grid2D(nx=5, ny=4, dx=1, origin=(1000, 2000), orientation=30)
+    with pytest.raises(NotImplementedError, match="orientation"):
+        g.fractional_indices([(1001, 2001)])
+
+
 def test_find_index_grid_with_negative_origin():
     # create a grid with negative origin
     bbox = [-1, -1, 1, 5]
@@ -410,6 +537,54 @@ def test_isel():
     assert g1.nx == 20
 
 
+def test_isel_index_stride():
+    g = Grid2D(bbox=[0, 0, 1, 5], nx=10, ny=20)
+
+    g2 = g.isel(range(2, 9, 3), axis="x")
+    assert isinstance(g2, Grid2D)
+    assert g2.nx == 3
+    assert g2.dx == pytest.approx(3 * g.dx)
+    assert np.allclose(g2.x, g.x[2:9:3])
+
+    g3 = g.isel(np.array([1, 3, 5, 7]), axis="y")
+    assert g3.ny == 4
+    assert np.allclose(g3.y, g.y[1:8:2])
+
+    assert isinstance(g.isel([1, 2, 4], axis="x"), GeometryUndefined)
+    assert isinstance(g.isel([4, 3, 2], axis="x"), GeometryUndefined)
+
+
+def test_grid3d_isel():
+    g = Grid3D(
+        x0=1.0,
+        dx=0.5,
+        nx=6,
+        y0=2.0,
+        dy=2.0,
+        ny=4,
+        z0=-3.0,
+        dz=1.0,
+        nz=3,
+        origin=(10.0, 20.0),
+    )
+
+    gxz = g.isel(1, axis="y")
+    assert isinstance(gxz, Grid2D)
+    assert np.allclose(gxz.x, g.x)
+    assert np.allclose(gxz.y, g.z)
+
+    gyz = g.isel(0, axis="x")
+    assert np.allclose(gyz.x, g.y)
+    assert np.allclose(gyz.y, g.z)
+
+    g2 = g.isel([2, 3, 4], axis="x")
+    assert isinstance(g2, Grid3D)
+    assert g2.nx == 3
+    assert np.allclose(g2.x, g.x[2:5])
+    assert np.allclose(g2.y, g.y)
+    assert np.allclose(g2.z, g.z)
+
+
 def test_grid2d_equality():
 
     g1 = Grid2D(dx=0.1, nx=2, dy=0.2, ny=4)